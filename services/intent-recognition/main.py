@@ -19,21 +19,39 @@ LangSmith tracing is enabled automatically when the environment provides:
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel
 
 # ── App ───────────────────────────────────────────────────────────────────────
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Populate get_model_with_tools' cache (see Shared handler) before the first
+    # request instead of during it.
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if api_key:
+        get_model_with_tools(api_key)
+    yield
+
+
 app = FastAPI(
     title="CollabBoard AI Service",
     description="claude-sonnet-4-6 powered whiteboard command interpreter.",
     version="5.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -591,18 +609,23 @@ class AICommandResponse(BaseModel):
 
 # ── Shared handler ────────────────────────────────────────────────────────────
 
-async def run_ai_command(body: AICommandRequest) -> AICommandResponse:
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-
+@lru_cache(maxsize=4)
+def get_model_with_tools(api_key: str) -> Runnable[LanguageModelInput, AIMessage]:
+    """Build the tool-bound chat model once per API key and reuse it across requests."""
     llm = ChatAnthropic(
         model="claude-sonnet-4-6",
         temperature=0,
         api_key=api_key,  # type: ignore[arg-type]
     )
+    return llm.bind_tools(TOOLS)
+
 
-    model_with_tools = llm.bind_tools(TOOLS)
+async def run_ai_command(body: AICommandRequest) -> dict[str, Any]:
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+
+    model_with_tools = get_model_with_tools(api_key)
 
     messages = [
         SystemMessage(content=build_system_prompt(body.board_state)),
@@ -611,38 +634,55 @@ async def run_ai_command(body: AICommandRequest) -> AICommandResponse:
 
     response = await model_with_tools.ainvoke(messages)
 
+    # Plain dicts: the endpoints' response_model validates and serializes them
+    # once, instead of building AICommandResponse here and dumping it again.
     tool_calls = [
-        ToolCallResult(name=tc["name"], args=tc.get("args") or {})
+        {"name": tc["name"], "args": tc.get("args") or {}}
         for tc in (response.tool_calls or [])
     ]
 
-    return AICommandResponse(
-        handler="langchain",
-        tool_calls=tool_calls,
-        message=str(response.content) if not tool_calls else None,
-    )
+    return {
+        "handler": "langchain",
+        "tool_calls": tool_calls,
+        "message": str(response.content) if not tool_calls else None,
+    }
 
 
 # ── Endpoints ─────────────────────────────────────────────────────────────────
 
 @app.post("/recognize-intent", response_model=AICommandResponse)
-async def recognize_intent(body: AICommandRequest) -> AICommandResponse:
+async def recognize_intent(body: AICommandRequest) -> dict[str, Any]:
     return await run_ai_command(body)
 
 
 @app.post("/api/v2/ai-command", response_model=AICommandResponse)
-async def ai_command_v2(body: AICommandRequest) -> AICommandResponse:
+async def ai_command_v2(body: AICommandRequest) -> dict[str, Any]:
     return await run_ai_command(body)
 
 
 # ── Health check ──────────────────────────────────────────────────────────────
 
+HEALTH_RESPONSE: dict[str, str] = {"status": "ok", "version": app.version}
+
+
 @app.get("/health")
-def health() -> dict[str, str]:
-    return {"status": "ok", "version": "5.0.0"}
+async def health() -> dict[str, str]:
+    return HEALTH_RESPONSE
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # Environment (read from the shell; no dotenv file is loaded):
+    #   DEV      1/true/yes (default) reloads on file changes; any other value
+    #            runs WORKERS processes instead (the reloader is single-process).
+    #   WORKERS  process count when DEV is off (default: CPU count).
+    #   PORT     listen port (default 8000).
+    dev = os.environ.get("DEV", "1").strip().lower() in ("1", "true", "yes")
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", "8000")),
+        reload=dev,
+        workers=1 if dev else int(os.environ.get("WORKERS", str(os.cpu_count() or 2))),
+    )